@@ -3,7 +3,17 @@
 # The bricks are alive, pulsing, exploding, and completely dominating the experience
 # Window: 600x400 (2.5x upscale from 240x160 GBA base)
 
-import math, random, time, sys, array
+import math, random, time, sys, array, os, gc, argparse, mmap, struct
+from collections import Counter
+
+# Soak runs headless: pick the dummy SDL drivers before pygame.init() grabs real ones.
+# Only the real command line is seen here; run_soak() swaps the video driver itself
+# when it's called some other way (e.g. main(["--soak"]) from another script).
+SOAK_MODE = "--soak" in sys.argv
+if SOAK_MODE:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
 import pygame
 
 # ----- Optional: numpy speeds up GBA color quantization (fallback if absent) -----
@@ -26,9 +36,17 @@ WIN_W, WIN_H = int(BASE_W * SCALE), int(BASE_H * SCALE)
 # Gameplay tuning (base-resolution units per second)
 PADDLE_W, PADDLE_H = 24, 3  # Smaller paddle - bricks dominate!
 PADDLE_SPEED = 140.0
+AUTOPILOT_MAX_AXIS = 4.0  # soak autopilot may drive the paddle at 4x PADDLE_SPEED
+AUTOPILOT_WHIFF = 0.03    # chance per serve/paddle hit that the autopilot misses on purpose
 BALL_SPEED = 95.0  # slower base - bricks control the pace
 BALL_R = 2
 MAX_FPS_CAP = 240
+ATTRACT_FPS = 15        # title / pause / game-over / ball-on-paddle redraw rate
+DEFAULT_REFRESH_HZ = 60 # when neither --refresh-hz/BREAKOUT_REFRESH_HZ nor SDL tells us
+SPIN_MARGIN = 0.002     # sleep() until this close to the deadline, then spin on perf_counter
+WAKE_EVENTS = (pygame.KEYDOWN, pygame.QUIT)  # only these cut an idle frame short
+PAUSE_REDRAW_EVENTS = (pygame.KEYDOWN, pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED,
+                       pygame.WINDOWSHOWN, pygame.WINDOWRESTORED)
 
 # Visual style toggles
 VIBES_ON = True
@@ -137,6 +155,109 @@ def make_scanline_overlay(w, h, alpha=60):
         pygame.draw.line(ov, dark, (0, y), (w, y))
     return ov
 
+# ---- Frame pacing: refresh-locked while playing, event.wait() when idle ----
+def display_refresh_hz(override=None):
+    """Refresh rate to pace play at: override, then $BREAKOUT_REFRESH_HZ, then SDL"""
+    if override:
+        return override
+    env = os.environ.get("BREAKOUT_REFRESH_HZ")
+    if env:
+        try:
+            hz = float(env)
+        except ValueError:
+            hz = 0
+        if hz > 0:
+            return hz
+        print(f"BREAKOUT_REFRESH_HZ={env!r} is not a positive number, ignoring it", file=sys.stderr)
+    # Stock pygame can't query the refresh rate; pygame-ce has
+    # get_current_refresh_rate() (2.4+) and get_desktop_refresh_rates() (2.2+)
+    for name in ("get_current_refresh_rate", "get_desktop_refresh_rates"):
+        fn = getattr(pygame.display, name, None)
+        if fn is None:
+            continue
+        try:
+            hz = fn()
+        except pygame.error:
+            continue
+        if isinstance(hz, (list, tuple)):
+            hz = hz[0] if hz else 0
+        if hz and hz > 0:
+            return hz
+    print(f"display refresh rate unknown, pacing at {DEFAULT_REFRESH_HZ} Hz "
+          f"(set --refresh-hz or BREAKOUT_REFRESH_HZ)", file=sys.stderr)
+    return DEFAULT_REFRESH_HZ
+
+class FrameScheduler:
+    """Replaces clock.tick(): hands out (dt, events) once the next frame is due"""
+    def __init__(self, target_fps):
+        self.target_fps = target_fps
+        self.last = self.deadline = time.perf_counter()
+        self.fps = 0.0
+        self.cpu_load = 0.0  # CPU seconds spent per wall second, updated every second
+        self.windows = 0     # bumps whenever fps/cpu_load are refreshed
+        self._frames = 0
+        self._idle = False
+        self._wall_mark = self.last
+        self._cpu_mark = time.process_time()
+
+    def _sleep_until(self, t):
+        # OS sleep overshoots by up to a timer slice, so finish the last stretch spinning
+        while True:
+            left = t - time.perf_counter()
+            if left <= 0:
+                return
+            if left > SPIN_MARGIN:
+                time.sleep(left - SPIN_MARGIN)
+
+    def wait(self, idle):
+        interval = 1.0 / (ATTRACT_FPS if idle else self.target_fps)
+        now = time.perf_counter()
+        due = self.deadline + interval
+        if due < now - interval:
+            due = now  # fell behind (or just woke from idle): don't burst to catch up
+
+        if idle:
+            # Block in SDL instead of spinning. Key presses wake us immediately;
+            # mouse/joystick/window noise is collected but waits for the deadline
+            events = []
+            while True:
+                ms = int((due - time.perf_counter()) * 1000)
+                if ms <= 0:
+                    break
+                ev = pygame.event.wait(ms)
+                if ev.type == pygame.NOEVENT:
+                    break
+                events.append(ev)
+                if ev.type in WAKE_EVENTS:
+                    break
+            events.extend(pygame.event.get())
+            now = time.perf_counter()
+            woke = any(ev.type in WAKE_EVENTS for ev in events)
+            self.deadline = now if woke else due
+        else:
+            self._sleep_until(due)
+            events = pygame.event.get()
+            now = time.perf_counter()
+            self.deadline = due
+            woke = False
+
+        dt = now - self.last
+        self.last = now
+        if woke or (self._idle and not idle):
+            # Coming out of idle (e.g. unpausing mid-flight): an attract-rate dt
+            # would move the ball ~13px in one step, straight through the paddle
+            dt = min(dt, 1.0 / self.target_fps)
+        self._idle = idle
+        self._frames += 1
+        span = now - self._wall_mark
+        if span >= 1.0:
+            cpu = time.process_time()
+            self.fps = self._frames / span
+            self.cpu_load = (cpu - self._cpu_mark) / span
+            self._frames, self._wall_mark, self._cpu_mark = 0, now, cpu
+            self.windows += 1
+        return dt, events
+
 # ---- Game objects ----
 class Paddle:
     def __init__(self, x, y):
@@ -215,17 +336,22 @@ class Brick:
         self.glow_intensity = min(1.0, self.hp / max(1, self.max_hp))
 
 class Breakout:
-    def __init__(self):
+    def __init__(self, autopilot=False, level_pack=None, refresh_hz=None):
         self.window = pygame.display.set_mode((WIN_W, WIN_H))
         pygame.display.set_caption("MEGA BRICK BREAKOUT — BRICKS > EVERYTHING")
         self.base = pygame.Surface((BASE_W, BASE_H))
         self.scanlines = make_scanline_overlay(BASE_W, BASE_H, alpha=56)
-        self.clock = pygame.time.Clock()
+        self.refresh_hz = display_refresh_hz(refresh_hz)
+        self.scheduler = FrameScheduler(self.refresh_hz)
         self.font = pygame.font.Font(None, 12)
         self.big_font = pygame.font.Font(None, 20)
         self.small_font = pygame.font.Font(None, 10)
         self.particles = []
         self.screen_shake = 0.0
+        self.game_time = 0.0  # animation clock; stands still while paused
+        self.autopilot = autopilot
+        self.autopilot_bias = 0.0
+        self.level_pack = level_pack  # LevelPack; None = procedural levels
         self.reset(hard=True)
 
     def reset(self, hard=False):
@@ -249,7 +375,10 @@ class Breakout:
         self.ball.stuck = True
 
         # MEGA BRICK LAYOUT
-        self.bricks = self.make_mega_level(self.level)
+        if self.level_pack is not None:
+            self.bricks = self.level_pack.bricks(self.level)
+        else:
+            self.bricks = self.make_mega_level(self.level)
         self.combo = 0
 
         # Ambient audio
@@ -278,7 +407,8 @@ class Breakout:
             ))
         self.reset(hard=False)
 
-    def make_mega_level(self, level):
+    @staticmethod
+    def make_mega_level(level):
         """BRICKS ARE EVERYTHING - Bigger, fewer, more special"""
         rng = random.Random(level)
         rows = min(6, 3 + level // 2)  # Fewer but BIGGER
@@ -355,13 +485,68 @@ class Breakout:
             b = max(0, min(255, b + random.randint(-30, 30)))
             self.particles.append(Particle(cx, cy, (r, g, b), vx, vy, life, size))
 
+    def serve(self):
+        """SPACE: start from title, restart after game over, or launch the ball"""
+        if self.state == "title":
+            self.state = "playing"
+            SFX["serve"].play()
+        elif self.state == "gameover":
+            self.score, self.lives, self.level = 0, 3, 1
+            self.reset(hard=True)
+        elif self.state == "playing" and self.ball.stuck:
+            ang = math.radians(random.uniform(40, 140))
+            speed = BALL_SPEED
+            self.ball.vx = speed * math.cos(ang)
+            self.ball.vy = -abs(speed * math.sin(ang))
+            self.ball.stuck = False
+            SFX["serve"].play()
+            if self.autopilot:
+                self.roll_autopilot_aim()
+
+    def roll_autopilot_aim(self):
+        """Pick where on the paddle the autopilot meets the next ball"""
+        # Off-centre for varied angles; now and then whiff on purpose so soak
+        # runs keep cycling through game-overs too
+        if random.random() < AUTOPILOT_WHIFF:
+            self.autopilot_bias = random.choice((-1, 1)) * PADDLE_W * 2
+        else:
+            self.autopilot_bias = random.uniform(-0.3, 0.3) * PADDLE_W
+
+    def predict_landing_x(self):
+        """Where the ball will cross the paddle line, folding in side-wall bounces"""
+        b, p = self.ball, self.paddle
+        if b.stuck or b.vy == 0:
+            return b.x
+        land_y = p.y  # ball rect first overlaps the paddle about here
+        if b.vy > 0:
+            dist = land_y - b.y
+        else:  # up to the ceiling and back down
+            top = self.bounds.top + b.r
+            dist = (b.y - top) + (land_y - top)
+        x = b.x + b.vx * max(0.0, dist) / abs(b.vy)
+        lo, hi = self.bounds.left + b.r, self.bounds.right - b.r
+        span = hi - lo
+        u = (x - lo) % (2 * span)
+        return lo + (2 * span - u if u > span else u)
+
+    def autopilot_axis(self):
+        """Steer the paddle centre towards the predicted landing spot (plus the serve's aim bias)"""
+        target = self.predict_landing_x() + self.autopilot_bias
+        err = target - (self.paddle.x + self.paddle.w * 0.5)
+        if abs(err) < 1.0:
+            return 0.0
+        return max(-AUTOPILOT_MAX_AXIS, min(AUTOPILOT_MAX_AXIS, err / 4.0))
+
     def handle_input(self, dt):
-        keys = pygame.key.get_pressed()
-        ax = 0.0
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            ax -= 1.0
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            ax += 1.0
+        if self.autopilot:
+            ax = self.autopilot_axis()
+        else:
+            keys = pygame.key.get_pressed()
+            ax = 0.0
+            if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+                ax -= 1.0
+            if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+                ax += 1.0
         self.paddle.vx = ax * PADDLE_SPEED
         self.paddle.x += self.paddle.vx * dt
         
@@ -424,6 +609,8 @@ class Breakout:
             offset = (b.x - (p.x + p.w / 2)) / (p.w / 2)
             b.vx += (offset * 55.0) + (p.vx * 0.2)
             SFX["paddle"].play()
+            if self.autopilot:
+                self.roll_autopilot_aim()
 
         # MEGA BRICK COLLISIONS
         hit_brick = None
@@ -551,7 +738,8 @@ class Breakout:
         self.base.fill((16, 20, 28))
 
     def draw_world(self, dt, fps):
-        t = pygame.time.get_ticks() * 0.001
+        self.game_time += dt
+        t = self.game_time
         
         # Update systems
         self.update_particles(dt)
@@ -573,7 +761,8 @@ class Breakout:
 
         # Update and draw MEGA BRICKS
         for br in self.bricks:
-            br.update(t, dt)
+            if self.state != "paused":
+                br.update(t, dt)
             
             # Draw brick with glow effect
             if br.glow_intensity > 0:
@@ -615,13 +804,14 @@ class Breakout:
         pygame.draw.circle(self.base, (255, 240, 192), (int(self.ball.x), int(self.ball.y)), self.ball.r)
 
         # HUD
-        hud = f"BRICKS: {len(self.bricks):02d}  SCORE {self.score:06d}  LV {self.level}  FPS {fps:3.0f}"
+        hud = (f"BRICKS: {len(self.bricks):02d}  SCORE {self.score:06d}  LV {self.level}  "
+               f"FPS {fps:3.0f}  CPU {self.scheduler.cpu_load * 100:3.0f}%")
         self.base.blit(self.small_font.render(hud, True, (248, 248, 248)), (8, 2))
 
         # Title / overlays
         if self.state == "title":
             msg = "BRICKS > ALL THE THINGS"
-            sub = "SPACE: serve • ←/→ move • V: vibes • G: GBA • B: particles"
+            sub = "SPACE: serve • ←/→ move • P: pause • V: vibes • G: GBA • B: particles"
             self.base.blit(self.big_font.render(msg, True, (255, 255, 210)), (25, 54))
             self.base.blit(self.small_font.render(sub, True, (225, 225, 210)), (18, 80))
             
@@ -635,6 +825,12 @@ class Breakout:
             pygame.draw.rect(self.base, demo_color, (BASE_W//2 - 20, demo_y, 40, 15))
             pygame.draw.rect(self.base, (0, 0, 0), (BASE_W//2 - 20, demo_y, 40, 15), 1)
             
+        elif self.state == "paused":
+            msg = "PAUSED"
+            sub = "P to resume"
+            self.base.blit(self.big_font.render(msg, True, (210, 230, 255)), (94, 56))
+            self.base.blit(self.small_font.render(sub, True, (220, 225, 240)), (96, 80))
+
         elif self.state == "gameover":
             msg = "BRICKS WIN"
             sub = "Press R to restart"
@@ -652,16 +848,31 @@ class Breakout:
         self.window.blit(scaled, (0, 0))
         pygame.display.flip()
 
-    def run(self):
+    def is_idle(self):
+        """True when nothing needs smooth animation and we can drop to ATTRACT_FPS"""
+        if self.state != "playing":
+            return True
+        if not self.ball.stuck or self.particles or self.screen_shake > 0:
+            return False
+        keys = pygame.key.get_pressed()
+        return not (keys[pygame.K_LEFT] or keys[pygame.K_a] or
+                    keys[pygame.K_RIGHT] or keys[pygame.K_d])
+
+    def run(self, cpu_report=False):
         global VIBES_ON, GBA_POSTFX_ON, AMBIENCE_CHANNEL, BRICK_PARTICLES_ON
         running = True
-        fps_cap = MAX_FPS_CAP
+        sched = self.scheduler
+        reported = sched.windows
+        pause_drawn = False
 
         while running:
-            dt = self.clock.tick(fps_cap) / 1000.0
-            fps = self.clock.get_fps()
+            dt, events = sched.wait(self.is_idle())
+            fps = sched.fps
+            if cpu_report and sched.windows != reported:
+                reported = sched.windows
+                print(f"{self.state:<8} fps {sched.fps:6.1f}  cpu {sched.cpu_load * 1000:6.1f} ms/s", flush=True)
 
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.KEYDOWN:
@@ -687,24 +898,25 @@ class Breakout:
                             AMBIENCE_CHANNEL = AMBIENCE.play(loops=-1)
                             if AMBIENCE_CHANNEL: AMBIENCE_CHANNEL.set_volume(0.25)
                     elif event.key == pygame.K_f:
-                        fps_cap = 60 if self.clock.get_fps() > 61 else MAX_FPS_CAP
+                        sched.target_fps = self.refresh_hz if sched.target_fps == MAX_FPS_CAP else MAX_FPS_CAP
+                    elif event.key == pygame.K_p:
+                        if self.state == "playing":
+                            self.state = "paused"
+                        elif self.state == "paused":
+                            self.state = "playing"
                     elif event.key == pygame.K_r:
                         self.score, self.lives, self.level = 0, 3, 1
                         self.reset(hard=True)
                     elif event.key == pygame.K_SPACE:
-                        if self.state == "title":
-                            self.state = "playing"
-                            SFX["serve"].play()
-                        elif self.state == "gameover":
-                            self.score, self.lives, self.level = 0, 3, 1
-                            self.reset(hard=True)
-                        elif self.ball.stuck:
-                            ang = math.radians(random.uniform(40, 140))
-                            speed = BALL_SPEED
-                            self.ball.vx = speed * math.cos(ang)
-                            self.ball.vy = -abs(speed * math.sin(ang))
-                            self.ball.stuck = False
-                            SFX["serve"].play()
+                        self.serve()
+
+            if self.state == "paused":
+                # Nothing moves while paused: draw once, then only on input or expose
+                if not pause_drawn or any(ev.type in PAUSE_REDRAW_EVENTS for ev in events):
+                    self.draw_world(0.0, fps)
+                    pause_drawn = True
+                continue
+            pause_drawn = False
 
             if self.state in ("title", "gameover"):
                 self.handle_input(dt)
@@ -718,6 +930,356 @@ class Breakout:
 
         pygame.quit()
 
+# ---- Level packs: fixed-size binary records, mmap'd so huge packs open instantly ----
+# Layout (little-endian):
+#   header  "MBLP" magic, u16 version, u16 brick record size, u32 level count
+#   index   per level: u32 file offset of its first brick record, u32 brick count
+#   records per brick: i16 x, i16 y, u16 w, u16 h, u8 type, u16 hp, u8 r, g, b
+PACK_MAGIC = b"MBLP"
+PACK_VERSION = 1
+PACK_HEADER = struct.Struct("<4sHHI")
+PACK_INDEX = struct.Struct("<II")
+PACK_BRICK = struct.Struct("<hhHHBH3B")
+
+class LevelPack:
+    """Read-only view of a level pack; levels are decoded only when asked for"""
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError) as e:
+            self._file.close()
+            if isinstance(e, ValueError):  # empty file can't be mapped
+                raise ValueError(f"{path}: not a level pack") from None
+            raise
+        try:
+            if len(self._mm) < PACK_HEADER.size:
+                raise ValueError(f"{path}: not a level pack")
+            magic, version, rec_size, count = PACK_HEADER.unpack_from(self._mm, 0)
+            if magic != PACK_MAGIC:
+                raise ValueError(f"{path}: not a level pack")
+            if version != PACK_VERSION or rec_size != PACK_BRICK.size:
+                raise ValueError(f"{path}: unsupported level pack version {version}")
+            if count == 0:
+                raise ValueError(f"{path}: level pack has no levels")
+            if PACK_HEADER.size + count * PACK_INDEX.size > len(self._mm):
+                raise ValueError(f"{path}: truncated level pack")
+        except (ValueError, struct.error):
+            self.close()
+            raise
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def records(self, level):
+        """Raw (x, y, w, h, type, hp, r, g, b) tuples for 1-based level; wraps past the end"""
+        i = (level - 1) % self.count
+        offset, n = PACK_INDEX.unpack_from(self._mm, PACK_HEADER.size + i * PACK_INDEX.size)
+        if offset + n * PACK_BRICK.size > len(self._mm):
+            raise ValueError(f"{self.path}: level {i + 1} runs past end of file")
+        return [PACK_BRICK.unpack_from(self._mm, offset + k * PACK_BRICK.size) for k in range(n)]
+
+    def bricks(self, level):
+        out = []
+        for x, y, w, h, t, hp, r, g, b in self.records(level):
+            if t >= len(Brick.TYPES):
+                raise ValueError(f"{self.path}: bad brick type {t} in level {level}")
+            out.append(Brick(x, y, w, h, hp, (r, g, b), Brick.TYPES[t]))
+        return out
+
+def _brick_record(br):
+    # Store the spawn rect/colour, not whatever an animated brick looks like right now
+    r = br.base_rect
+    return PACK_BRICK.pack(r.x, r.y, r.width, r.height, Brick.TYPES.index(br.type),
+                           br.max_hp, *br.base_color)
+
+def write_level_pack(path, levels):
+    """Write a pack from a sequence of brick lists (level 1 first)"""
+    levels = [list(bricks) for bricks in levels]
+    if not levels:
+        raise ValueError("level pack needs at least one level")
+    index, body = [], bytearray()
+    offset = PACK_HEADER.size + len(levels) * PACK_INDEX.size
+    for i, bricks in enumerate(levels, 1):
+        if not bricks:
+            raise ValueError(f"level {i} has no bricks and could never be cleared")
+        index.append(PACK_INDEX.pack(offset + len(body), len(bricks)))
+        for br in bricks:
+            body += _brick_record(br)
+    with open(path, "wb") as f:
+        f.write(PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, PACK_BRICK.size, len(levels)))
+        f.write(b"".join(index))
+        f.write(body)
+
+def bake_level_pack(path, count):
+    """Bake levels 1..count of the procedural generator into a pack"""
+    write_level_pack(path, (Breakout.make_mega_level(n) for n in range(1, count + 1)))
+
+def verify_level_pack(path):
+    """Compare every level in a pack with make_mega_level; returns a list of mismatch messages.
+
+    Brick() also draws move/rainbow phases from the global RNG, so matching brick
+    lists consume it identically and the levels animate the same way too."""
+    problems = []
+    with LevelPack(path) as pack:
+        for n in range(1, len(pack) + 1):
+            want = [PACK_BRICK.unpack(_brick_record(br)) for br in Breakout.make_mega_level(n)]
+            got = [PACK_BRICK.unpack(_brick_record(br)) for br in pack.bricks(n)]
+            if len(want) != len(got):
+                problems.append(f"level {n}: {len(got)} bricks, expected {len(want)}")
+                continue
+            for k, (a, b) in enumerate(zip(got, want)):
+                if a != b:
+                    problems.append(f"level {n} brick {k}: {a} != {b}")
+    return problems
+
+# ---- Soak harness: autopilot plays for hours, we watch for anything that grows ----
+SOAK_DT = 1.0 / 60.0         # fixed sim step; no clock.tick so time runs accelerated
+SOAK_WARMUP_FRAC = 0.2       # ignore the first samples (caches, font glyphs, mixer warmup)
+SOAK_MIN_SAMPLES = 6
+SOAK_RSS_SLACK = 8 * 1024 * 1024
+SOAK_COUNT_SLACK = 200       # absolute growth allowed for any object type / game counter
+SOAK_COUNT_FRAC = 0.10       # ...and relative growth
+SOAK_FRAME_FRAC = 0.25       # frame-time drift allowed
+SOAK_FRAME_SLACK_MS = 0.5
+
+def _rss_bytes():
+    """Current resident set size; falls back to peak RSS where /proc is missing"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def _busy_channels():
+    if not pygame.mixer.get_init():
+        return 0
+    return sum(1 for i in range(pygame.mixer.get_num_channels())
+               if pygame.mixer.Channel(i).get_busy())
+
+def _slope(xs, ys):
+    """Least-squares slope of ys over xs"""
+    n = len(xs)
+    mx, my = sum(xs) / n, sum(ys) / n
+    den = sum((x - mx) ** 2 for x in xs)
+    if den == 0:
+        return 0.0
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / den
+
+def _rise(ys):
+    """Mean of the last third minus mean of the first third (smooths out jitter)"""
+    k = max(1, len(ys) // 3)
+    head, tail = ys[:k], ys[-k:]
+    return sum(tail) / len(tail) - sum(head) / len(head), sum(head) / len(head)
+
+class SoakMonitor:
+    def __init__(self, game):
+        self.game = game
+        self.samples = []  # (elapsed_s, metrics dict)
+        self.start = time.perf_counter()
+        self.frame_time = 0.0
+        self.frames = 0
+        self.levels = 0      # level clears seen
+        self.gameovers = 0
+
+    def frame(self, seconds):
+        self.frame_time += seconds
+        self.frames += 1
+
+    def sample(self):
+        gc.collect()
+        g = self.game
+        metrics = {
+            "rss_bytes": _rss_bytes(),
+            "frame_ms": 1000.0 * self.frame_time / max(1, self.frames),
+            "game:particles": len(g.particles),
+            "game:ball_trail": len(g.ball.trail),
+            "game:bricks": len(g.bricks),
+            "game:mixer_busy": _busy_channels(),
+            "game:mixer_channels": pygame.mixer.get_num_channels() if pygame.mixer.get_init() else 0,
+        }
+        for name, n in Counter(type(o).__name__ for o in gc.get_objects()).items():
+            metrics["type:" + name] = n
+        self.samples.append((time.perf_counter() - self.start, metrics))
+        self.frame_time, self.frames = 0.0, 0
+        return metrics
+
+    def analysed_samples(self):
+        """Samples left for trend analysis once warmup is dropped"""
+        return self.samples[int(len(self.samples) * SOAK_WARMUP_FRAC):]
+
+    def failures(self):
+        """Return [(metric, first, last, rise)] for every metric trending upward"""
+        samples = self.analysed_samples()
+        if len(samples) < SOAK_MIN_SAMPLES:
+            return []
+        xs = [t for t, _ in samples]
+        names = set()
+        for _, m in samples:
+            names.update(m)
+        bad = []
+        for name in sorted(names):
+            if name == "game:bricks":
+                continue  # legitimately swings with level progress
+            ys = [m.get(name, 0) for _, m in samples]
+            rise, base = _rise(ys)
+            if name == "rss_bytes":
+                limit = max(SOAK_RSS_SLACK, 0.05 * base)
+            elif name == "frame_ms":
+                limit = max(SOAK_FRAME_SLACK_MS, SOAK_FRAME_FRAC * base)
+            else:
+                limit = max(SOAK_COUNT_SLACK, SOAK_COUNT_FRAC * base)
+            if rise > limit and _slope(xs, ys) > 0:
+                bad.append((name, ys[0], ys[-1], rise))
+        return bad
+
+    def report(self, out=sys.stdout):
+        bad = self.failures()
+        first, last = self.samples[0][1], self.samples[-1][1]
+        print(f"soak: {len(self.samples)} samples over {self.samples[-1][0] / 60.0:.1f} min, "
+              f"{self.levels} levels cleared, {self.gameovers} game-overs", file=out)
+        for name in ("rss_bytes", "frame_ms", "game:particles", "game:ball_trail",
+                     "game:mixer_busy", "game:mixer_channels"):
+            print(f"  {name:<22} {first.get(name, 0):>14.1f} -> {last.get(name, 0):>14.1f}", file=out)
+        kept = len(self.analysed_samples())
+        inconclusive = kept < SOAK_MIN_SAMPLES
+        if inconclusive:
+            print(f"soak: FAIL, inconclusive: {kept} samples after warmup, "
+                  f"need {SOAK_MIN_SAMPLES} for trend analysis", file=out)
+        if self.levels == 0:
+            # Never leaving level 1 means next_level()/reset() were never soaked
+            print("soak: FAIL, autopilot never cleared a level", file=out)
+        if bad:
+            print("soak: FAIL, growing metrics:", file=out)
+            for name, a, b, rise in bad:
+                print(f"  {name:<30} {a:>14.1f} -> {b:>14.1f}  (rise {rise:+.1f})", file=out)
+        if bad or inconclusive or self.levels == 0:
+            return False
+        print("soak: OK, nothing trends upward", file=out)
+        return True
+
+def _use_dummy_video():
+    if pygame.display.get_init() and pygame.display.get_driver() == "dummy":
+        return
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.display.quit()
+    pygame.display.init()
+
+def run_soak(minutes=60.0, interval=30.0, level_pack=None):
+    """Autopilot plays at an accelerated fixed step; returns a process exit code"""
+    _use_dummy_video()
+    game = Breakout(autopilot=True, level_pack=level_pack)
+    mon = SoakMonitor(game)
+    deadline = time.perf_counter() + minutes * 60.0
+    next_sample = time.perf_counter() + interval
+    last_level, last_state = game.level, game.state
+    fps = 1.0 / SOAK_DT
+
+    while time.perf_counter() < deadline:
+        t0 = time.perf_counter()
+        pygame.event.pump()
+        if game.state != "playing" or game.ball.stuck:
+            game.serve()
+        game.handle_input(SOAK_DT)
+        if game.state == "playing":
+            game.update_ball(SOAK_DT)
+        game.draw_world(SOAK_DT, fps)
+        t1 = time.perf_counter()
+        mon.frame(t1 - t0)
+        fps = 1.0 / max(1e-6, t1 - t0)
+
+        if game.level > last_level:
+            mon.levels += 1
+        if game.state == "gameover" and last_state != "gameover":
+            mon.gameovers += 1
+        last_level, last_state = game.level, game.state
+
+        if t1 >= next_sample:
+            m = mon.sample()
+            print(f"soak: t={mon.samples[-1][0]:7.0f}s rss={m['rss_bytes'] / 1e6:7.1f}MB "
+                  f"frame={m['frame_ms']:6.3f}ms particles={m['game:particles']} "
+                  f"levels={mon.levels} gameovers={mon.gameovers}", flush=True)
+            next_sample += interval
+
+    mon.sample()
+    ok = mon.report()
+    pygame.quit()
+    return 0 if ok else 1
+
 # ---- Entry point ----
+def main(argv=None):
+    """Parse the command line and run; returns a process exit code"""
+    ap = argparse.ArgumentParser(description="MEGA BRICK BREAKOUT")
+    ap.add_argument("--soak", action="store_true",
+                    help="headless autopilot soak test with leak detection")
+    ap.add_argument("--soak-minutes", type=float, default=60.0,
+                    help="wall-clock soak duration (default 60)")
+    ap.add_argument("--soak-interval", type=float, default=30.0,
+                    help="seconds between samples (default 30)")
+    ap.add_argument("--pack", metavar="PATH", help="play levels from a level pack")
+    ap.add_argument("--bake-pack", metavar="PATH",
+                    help="bake procedural levels into a level pack and exit")
+    ap.add_argument("--levels", type=int, default=100,
+                    help="number of levels for --bake-pack (default 100)")
+    ap.add_argument("--verify-pack", metavar="PATH",
+                    help="check a pack matches the procedural levels and exit")
+    ap.add_argument("--refresh-hz", type=float, metavar="HZ",
+                    help="display refresh rate to pace play at "
+                         "(default: $BREAKOUT_REFRESH_HZ, else detected, else 60)")
+    ap.add_argument("--cpu-report", action="store_true",
+                    help="print fps and CPU ms per wall second, once a second")
+    args = ap.parse_args(argv)
+    if args.soak:
+        if args.soak_interval <= 0:
+            ap.error("--soak-interval must be positive")
+        # Interval samples plus the final one, minus what warmup throws away
+        n = int(args.soak_minutes * 60.0 // args.soak_interval) + 1
+        if n - int(n * SOAK_WARMUP_FRAC) < SOAK_MIN_SAMPLES:
+            ap.error(f"--soak-minutes {args.soak_minutes:g} at --soak-interval {args.soak_interval:g}s "
+                     f"gives too few samples for trend analysis (need {SOAK_MIN_SAMPLES} after warmup)")
+    if args.refresh_hz is not None and args.refresh_hz <= 0:
+        ap.error("--refresh-hz must be positive")
+    if args.bake_pack and args.levels < 1:
+        ap.error("--levels must be at least 1")
+    if args.bake_pack:
+        bake_level_pack(args.bake_pack, args.levels)
+        print(f"baked {args.levels} levels into {args.bake_pack}")
+        return 0
+    if args.verify_pack:
+        problems = verify_level_pack(args.verify_pack)
+        for msg in problems:
+            print(msg)
+        print(f"{args.verify_pack}: {'OK' if not problems else f'{len(problems)} mismatches'}")
+        return 1 if problems else 0
+    pack = LevelPack(args.pack) if args.pack else None
+    try:
+        if args.soak:
+            return run_soak(args.soak_minutes, args.soak_interval, pack)
+        Breakout(level_pack=pack, refresh_hz=args.refresh_hz).run(cpu_report=args.cpu_report)
+        return 0
+    finally:
+        if pack is not None:
+            pack.close()
+
 if __name__ == "__main__":
-    Breakout().run()
+    sys.exit(main())